@@ -1,134 +1,286 @@
 # data_module.py
 from __future__ import annotations
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
 from typing import Optional, Dict
 
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+_CSV_ENGINE = "pyarrow" if HAS_PYARROW else "c"
+
+_MONTHS = {
+    "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4, "May": 5, "Jun": 6,
+    "Jul": 7, "Aug": 8, "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12,
+}
+
 
 # ---------- Loading & preparation ----------
 
 def load_dwellings_csv(path: str) -> pd.DataFrame:
     """
     Load the ABS 'Total dwellings commenced' CSV and return a cleaned DataFrame with:
-    - Period (str), Trend (int), Seasonally adjusted (int), Date (datetime), Year (int), Quarter (str)
+    - Period (category), Trend (int32), Seasonally adjusted (int32), Date (datetime), Year (int), Quarter (category)
     """
+    if _CSV_ENGINE == "c":
+        # The C parser strips thousands separators while tokenising
+        parse_opts = {"dtype": {"Period": "str"}, "thousands": ","}
+    else:
+        # pyarrow has no 'thousands' option; the separators are stripped below
+        parse_opts = {"dtype": {"Period": "str", "Trend": "str", "Seasonally adjusted": "str"}}
+
     df = pd.read_csv(
         path,
-        skiprows=1,  # skip the title row
+        skiprows=2,  # skip the title row and the column-header row
         names=["Period", "Trend", "Seasonally adjusted"],
         usecols=[0, 1, 2],
-        dtype=str,
-        engine="python",
+        engine=_CSV_ENGINE,  # pyarrow when installed, otherwise pandas' C parser
         on_bad_lines="skip",
+        cache_dates=True,
+        **parse_opts,
     )
 
-    # Keep only rows like 'Mar-17' (filter out headers/blank/source rows)
-    mask_period_like = df["Period"].str.match(r"^[A-Za-z]{3}-\d{2}$", na=False)
+    # Keep only rows like 'Mar-17' (filter out blank/source rows).
+    # Checked on the fixed 'Mmm-YY' shape with vectorised string ops, no regex.
+    p = df["Period"].fillna("")
+    mask_period_like = (
+        (p.str.len() == 6)
+        & (p.str.slice(3, 4) == "-")
+        & p.str.slice(0, 3).str.isalpha()
+        & p.str.slice(4, 6).str.isdigit()
+    )
     df = df[mask_period_like].copy()
 
-    # Convert numeric strings with thousands separators
-    for col in ["Trend", "Seasonally adjusted"]:
-        df[col] = df[col].str.replace(",", "", regex=False).astype(int)
+    value_cols = ["Trend", "Seasonally adjusted"]
+    if _CSV_ENGINE != "c":
+        df[value_cols] = df[value_cols].apply(lambda col: col.str.replace(",", "", regex=False))
+    # Counts are tens of thousands, so int32 halves the footprint of int64
+    values = df[value_cols].astype(np.int64)
+    if (values.abs() > np.iinfo(np.int32).max).any(axis=None):
+        raise ValueError("Dwelling counts do not fit in int32")
+    df[value_cols] = values.astype(np.int32)
 
     # Period -> datetime; add helpers
-    df["Date"] = pd.to_datetime(df["Period"], format="%b-%y")
+    # built from integer parts via a month lookup rather than strptime on every row
+    # %b was case-insensitive, so accept 'MAR-17' / 'mar-17' too
+    month = df["Period"].str.slice(0, 3).str.title().map(_MONTHS)
+    if month.isna().any():
+        bad = df.loc[month.isna(), "Period"].unique().tolist()
+        raise ValueError(f"Unrecognised month abbreviation in Period: {bad}")
+    month = month.astype("int16")
+    year = 2000 + df["Period"].str.slice(4, 6).astype("int16")
+    df["Date"] = pd.to_datetime({"year": year, "month": month, "day": 1})
     df = df.sort_values("Date").reset_index(drop=True)
     df["Year"] = df["Date"].dt.year
-    df["Quarter"] = df["Date"].dt.to_period("Q").astype(str)
+    # 'YYYYQn' labels from integer month arithmetic, no Period objects
+    years = df["Year"].to_numpy().astype(str)
+    quarters = ((df["Date"].dt.month.to_numpy() - 1) // 3 + 1).astype(str)
+    # Low-cardinality labels: store as small integer codes plus a shared lookup
+    df["Quarter"] = pd.Categorical(np.char.add(np.char.add(years, "Q"), quarters))
+    df["Period"] = df["Period"].astype("category")
     return df
 
 
+def _pct_change(x: np.ndarray, periods: int) -> np.ndarray:
+    """Percent change over `periods` rows; the first `periods` values are NaN."""
+    out = np.empty_like(x)
+    out[:periods] = np.nan
+    # A zero base gives inf/nan silently, as Series.pct_change did
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out[periods:] = (x[periods:] / x[:-periods] - 1.0) * 100.0
+    return out
+
+
+def _rolling_mean(x: np.ndarray, window: int) -> np.ndarray:
+    """Trailing mean over `window` rows, averaging what is available at the start (min_periods=1)."""
+    out = np.empty_like(x)
+    head = min(window - 1, len(x))
+    out[:head] = np.cumsum(x[:head]) / np.arange(1, head + 1)
+    if len(x) >= window:
+        out[head:] = np.convolve(x, np.ones(window) / window, mode="valid")
+    return out
+
+
+def _metrics_numpy(t: np.ndarray, s: np.ndarray) -> tuple[np.ndarray, ...]:
+    return (
+        _pct_change(t, 1), _pct_change(s, 1),
+        _pct_change(t, 4), _pct_change(s, 4),
+        _rolling_mean(t, 4), _rolling_mean(s, 4),
+    )
+
+
+def _metrics_loop(t: np.ndarray, s: np.ndarray) -> tuple[np.ndarray, ...]:
+    """Single-pass kernel for numba; same outputs and order as _metrics_numpy."""
+    n = t.shape[0]
+    t_qoq, s_qoq = np.empty(n), np.empty(n)
+    t_yoy, s_yoy = np.empty(n), np.empty(n)
+    t_ma, s_ma = np.empty(n), np.empty(n)
+    t_sum = 0.0
+    s_sum = 0.0
+    for i in range(n):
+        t_qoq[i] = (t[i] / t[i - 1] - 1.0) * 100.0 if i >= 1 else np.nan
+        s_qoq[i] = (s[i] / s[i - 1] - 1.0) * 100.0 if i >= 1 else np.nan
+        t_yoy[i] = (t[i] / t[i - 4] - 1.0) * 100.0 if i >= 4 else np.nan
+        s_yoy[i] = (s[i] / s[i - 4] - 1.0) * 100.0 if i >= 4 else np.nan
+        t_sum += t[i]
+        s_sum += s[i]
+        if i >= 4:
+            t_sum -= t[i - 4]
+            s_sum -= s[i - 4]
+        count = min(i + 1, 4)
+        t_ma[i] = t_sum / count
+        s_ma[i] = s_sum / count
+    return t_qoq, s_qoq, t_yoy, s_yoy, t_ma, s_ma
+
+
+# Below this many rows NumPy beats the cost of importing numba and loading the kernel
+_NUMBA_MIN_ROWS = 1_000_000
+_numba_metrics = None
+
+
+def _compute_metrics(t: np.ndarray, s: np.ndarray) -> tuple[np.ndarray, ...]:
+    global _numba_metrics
+    if len(t) >= _NUMBA_MIN_ROWS:
+        if _numba_metrics is None:
+            try:
+                from numba import njit
+            except ImportError:
+                _numba_metrics = False
+            else:
+                # numpy error model: x / 0 gives inf/nan like the NumPy path, not ZeroDivisionError
+                _numba_metrics = njit(cache=True, error_model="numpy")(_metrics_loop)
+        if _numba_metrics is not False:
+            return _numba_metrics(t, s)
+    return _metrics_numpy(t, s)
+
+
 def add_growth_and_ma(df: pd.DataFrame) -> pd.DataFrame:
     """
     Add QoQ/YoY growth (%) and 4-quarter moving averages for both series.
+    Returns a new DataFrame; the input is left unchanged.
     """
-    df = df.copy()
-    df["Trend_qoq_pct"] = df["Trend"].pct_change() * 100
-    df["SA_qoq_pct"] = df["Seasonally adjusted"].pct_change() * 100
-    df["Trend_yoy_pct"] = df["Trend"].pct_change(4) * 100
-    df["SA_yoy_pct"] = df["Seasonally adjusted"].pct_change(4) * 100
-    df["Trend_4q_ma"] = df["Trend"].rolling(4, min_periods=1).mean()
-    df["SA_4q_ma"] = df["Seasonally adjusted"].rolling(4, min_periods=1).mean()
-    return df
+    values = df[["Trend", "Seasonally adjusted"]].to_numpy(dtype=np.float64)
+    t_qoq, s_qoq, t_yoy, s_yoy, t_ma, s_ma = _compute_metrics(
+        np.ascontiguousarray(values[:, 0]), np.ascontiguousarray(values[:, 1])
+    )
+    return df.assign(
+        Trend_qoq_pct=t_qoq,
+        SA_qoq_pct=s_qoq,
+        Trend_yoy_pct=t_yoy,
+        SA_yoy_pct=s_yoy,
+        Trend_4q_ma=t_ma,
+        SA_4q_ma=s_ma,
+    )
 
 
 def summarize_series(df: pd.DataFrame) -> Dict[str, int | str | float]:
     """
     Return latest values, growth rates, and historical peaks.
     """
-    latest = df.iloc[-1]
+    # Look each column up once; read the latest values positionally instead of
+    # materialising the last row as a mixed-dtype Series
+    trend = df["Trend"].to_numpy()
+    sa = df["Seasonally adjusted"].to_numpy()
+    period = df["Period"]
+    trend_qoq = df["Trend_qoq_pct"].iat[-1]
+    sa_qoq = df["SA_qoq_pct"].iat[-1]
+    trend_yoy = df["Trend_yoy_pct"].iat[-1]
+    sa_yoy = df["SA_yoy_pct"].iat[-1]
+    trend_max, trend_min = trend.argmax(), trend.argmin()
+    sa_max, sa_min = sa.argmax(), sa.argmin()
     summary = {
-        "latest_period": latest["Period"],
-        "latest_trend": int(latest["Trend"]),
-        "latest_sa": int(latest["Seasonally adjusted"]),
-        "trend_qoq_pct": float(latest["Trend_qoq_pct"]) if pd.notna(latest["Trend_qoq_pct"]) else None,
-        "sa_qoq_pct": float(latest["SA_qoq_pct"]) if pd.notna(latest["SA_qoq_pct"]) else None,
-        "trend_yoy_pct": float(latest["Trend_yoy_pct"]) if pd.notna(latest["Trend_yoy_pct"]) else None,
-        "sa_yoy_pct": float(latest["SA_yoy_pct"]) if pd.notna(latest["SA_yoy_pct"]) else None,
-        "trend_peak": int(df["Trend"].max()),
-        "trend_peak_period": df.loc[df["Trend"].idxmax(), "Period"],
-        "sa_peak": int(df["Seasonally adjusted"].max()),
-        "sa_peak_period": df.loc[df["Seasonally adjusted"].idxmax(), "Period"],
-        "trend_trough": int(df["Trend"].min()),
-        "trend_trough_period": df.loc[df["Trend"].idxmin(), "Period"],
-        "sa_trough": int(df["Seasonally adjusted"].min()),
-        "sa_trough_period": df.loc[df["Seasonally adjusted"].idxmin(), "Period"],
+        "latest_period": period.iat[-1],
+        "latest_trend": int(trend[-1]),
+        "latest_sa": int(sa[-1]),
+        "trend_qoq_pct": float(trend_qoq) if pd.notna(trend_qoq) else None,
+        "sa_qoq_pct": float(sa_qoq) if pd.notna(sa_qoq) else None,
+        "trend_yoy_pct": float(trend_yoy) if pd.notna(trend_yoy) else None,
+        "sa_yoy_pct": float(sa_yoy) if pd.notna(sa_yoy) else None,
+        "trend_peak": int(trend[trend_max]),
+        "trend_peak_period": period.iat[trend_max],
+        "sa_peak": int(sa[sa_max]),
+        "sa_peak_period": period.iat[sa_max],
+        "trend_trough": int(trend[trend_min]),
+        "trend_trough_period": period.iat[trend_min],
+        "sa_trough": int(sa[sa_min]),
+        "sa_trough_period": period.iat[sa_min],
     }
     return summary
 
 
 # ---------- Plotting ----------
 
-def plot_trend_vs_sa(df: pd.DataFrame, save_path: Optional[str] = None, show: bool = False):
-    plt.figure(figsize=(12, 6))
-    plt.plot(df["Date"], df["Trend"], label="Trend", marker="o", linewidth=2)
-    plt.plot(df["Date"], df["Seasonally adjusted"], label="Seasonally adjusted", marker="s", linewidth=2)
-    plt.title("Total dwellings commenced — Trend vs Seasonally adjusted")
-    plt.xlabel("Date")
-    plt.ylabel("Number of dwellings")
-    plt.grid(True, linestyle="--", alpha=0.5)
-    plt.legend()
-    plt.tight_layout()
-    if save_path:
-        plt.savefig(save_path, dpi=150)
+# matplotlib is imported on first plot so summary/export paths skip its start-up cost.
+# Save-only charts clear and redraw one standalone Figure: it renders PNGs through its
+# own Agg canvas, so neither pyplot nor a GUI backend is loaded and the caller's backend
+# is left alone.
+_FIG = None
+
+
+def _new_axes(figsize: tuple[float, float], show: bool):
+    global _FIG
     if show:
-        plt.show()
+        import matplotlib.pyplot as plt
+
+        # pyplot forgets a figure once its window is closed, so each shown chart gets its own
+        fig = plt.figure(figsize=figsize)
     else:
-        plt.close()
+        if _FIG is None:
+            from matplotlib.figure import Figure
 
+            _FIG = Figure(figsize=figsize)
+        fig = _FIG
+        fig.clf()
+        fig.set_size_inches(*figsize)
+    return fig.add_subplot(111)
 
-def plot_sa_qoq(df: pd.DataFrame, save_path: Optional[str] = None, show: bool = False):
-    colors = ["#2b8cbe" if v >= 0 else "#de2d26" for v in df["SA_qoq_pct"].fillna(0)]
-    plt.figure(figsize=(12, 5))
-    # Width ~ 70 days so bars are readable on a quarterly timeline
-    plt.bar(df["Date"], df["SA_qoq_pct"], width=70, color=colors)
-    plt.axhline(0, color="black", linewidth=1)
-    plt.title("Quarter-over-quarter growth — Seasonally adjusted (%)")
-    plt.xlabel("Date")
-    plt.ylabel("Percent")
-    plt.grid(True, axis="y", linestyle="--", alpha=0.4)
-    plt.tight_layout()
+
+def _finish(ax, save_path: Optional[str], show: bool):
+    fig = ax.figure
+    fig.tight_layout()
     if save_path:
-        plt.savefig(save_path, dpi=150)
+        # Default 100 dpi and fast zlib compression keep PNG encoding cheap
+        fig.savefig(save_path, bbox_inches=None, pil_kwargs={"compress_level": 1})
     if show:
+        import matplotlib.pyplot as plt
+
         plt.show()
-    else:
-        plt.close()
+
+
+def plot_trend_vs_sa(df: pd.DataFrame, save_path: Optional[str] = None, show: bool = False):
+    ax = _new_axes((12, 6), show)
+    ax.plot(df["Date"], df["Trend"], label="Trend", marker="o", linewidth=2)
+    ax.plot(df["Date"], df["Seasonally adjusted"], label="Seasonally adjusted", marker="s", linewidth=2)
+    ax.set_title("Total dwellings commenced — Trend vs Seasonally adjusted")
+    ax.set_xlabel("Date")
+    ax.set_ylabel("Number of dwellings")
+    ax.grid(True, linestyle="--", alpha=0.5)
+    ax.legend()
+    _finish(ax, save_path, show)
+
+
+def plot_sa_qoq(df: pd.DataFrame, save_path: Optional[str] = None, show: bool = False):
+    colors = np.where(df["SA_qoq_pct"].fillna(0).to_numpy() >= 0, "#2b8cbe", "#de2d26")
+    ax = _new_axes((12, 5), show)
+    # Width ~ 70 days so bars are readable on a quarterly timeline
+    ax.bar(df["Date"], df["SA_qoq_pct"], width=70, color=colors)
+    ax.axhline(0, color="black", linewidth=1)
+    ax.set_title("Quarter-over-quarter growth — Seasonally adjusted (%)")
+    ax.set_xlabel("Date")
+    ax.set_ylabel("Percent")
+    ax.grid(True, axis="y", linestyle="--", alpha=0.4)
+    _finish(ax, save_path, show)
 
 
 def plot_sa_with_ma(df: pd.DataFrame, save_path: Optional[str] = None, show: bool = False):
-    plt.figure(figsize=(12, 6))
-    plt.plot(df["Date"], df["Seasonally adjusted"], label="Seasonally adjusted", color="#888", alpha=0.6)
-    plt.plot(df["Date"], df["SA_4q_ma"], label="Seasonally adjusted (4-quarter MA)", color="#08519c", linewidth=2.5)
-    plt.title("Seasonally adjusted with 4-quarter moving average")
-    plt.xlabel("Date")
-    plt.ylabel("Number of dwellings")
-    plt.grid(True, linestyle="--", alpha=0.5)
-    plt.legend()
-    plt.tight_layout()
-    if save_path:
-        plt.savefig(save_path, dpi=150)
-    if show:
-        plt.show()
-    else:
-        plt.close()
+    ax = _new_axes((12, 6), show)
+    ax.plot(df["Date"], df["Seasonally adjusted"], label="Seasonally adjusted", color="#888", alpha=0.6)
+    ax.plot(df["Date"], df["SA_4q_ma"], label="Seasonally adjusted (4-quarter MA)", color="#08519c", linewidth=2.5)
+    ax.set_title("Seasonally adjusted with 4-quarter moving average")
+    ax.set_xlabel("Date")
+    ax.set_ylabel("Number of dwellings")
+    ax.grid(True, linestyle="--", alpha=0.5)
+    ax.legend()
+    _finish(ax, save_path, show)
@@ -1,9 +1,13 @@
 # main.py
 from __future__ import annotations
 from pathlib import Path
+import json
 import sys
 
+import pandas as pd
+
 from data_module import (
+    HAS_PYARROW,
     load_dwellings_csv,
     add_growth_and_ma,
     summarize_series,
@@ -15,6 +19,11 @@ from data_module import (
 # Uses your known CSV in the same folder as this script
 CSV_PATH = Path(__file__).with_name("Total dwellings commenced (1) (1).csv")
 OUTDIR = Path("figures")
+# Parsed + augmented data, reused while the CSV's mtime/size are unchanged
+CACHE_PATH = OUTDIR / "dwellings.parquet"
+CACHE_META_PATH = CACHE_PATH.with_suffix(".meta")
+# Bump when the prepared DataFrame's columns or dtypes change
+CACHE_VERSION = 2
 
 
 def print_header():
@@ -28,7 +37,8 @@ def print_menu():
     print("  1) Show latest summary")
     print("  2) Show peaks and troughs")
     print("  3) Generate charts (PNG files)")
-    print("  4) Export cleaned dataset with metrics (CSV)")
+    export_formats = "CSV + Parquet" if HAS_PYARROW else "CSV"
+    print(f"  4) Export cleaned dataset with metrics ({export_formats})")
     print("  5) Exit")
 
 
@@ -37,13 +47,38 @@ def ensure_data():
         print(f"\nERROR: CSV not found at: {CSV_PATH.name}")
         print("Place the CSV in the same folder as this script and try again.")
         sys.exit(1)
-    df = load_dwellings_csv(str(CSV_PATH))
-    df = add_growth_and_ma(df)
+    stat = CSV_PATH.stat()
+    signature = {"version": CACHE_VERSION, "mtime": stat.st_mtime, "size": stat.st_size}
+    df = load_cached_data(signature)
+    if df is None:
+        df = load_dwellings_csv(str(CSV_PATH))
+        df = add_growth_and_ma(df)
+        save_cached_data(df, signature)
     return df
 
 
-def show_latest_summary(df):
-    s = summarize_series(df)
+def load_cached_data(signature):
+    if not (CACHE_PATH.exists() and CACHE_META_PATH.exists()):
+        return None
+    try:
+        if json.loads(CACHE_META_PATH.read_text()) != signature:
+            return None
+        return pd.read_parquet(CACHE_PATH, engine="pyarrow")
+    except (ImportError, OSError, ValueError):
+        # Missing pyarrow or a corrupt cache: fall back to parsing the CSV
+        return None
+
+
+def save_cached_data(df, signature):
+    try:
+        OUTDIR.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(CACHE_PATH, engine="pyarrow", compression="zstd", index=False)
+    except (ImportError, OSError):
+        return
+    CACHE_META_PATH.write_text(json.dumps(signature))
+
+
+def show_latest_summary(s):
     print("\nLatest summary")
     print("-" * 64)
     print(f"Period: {s['latest_period']}")
@@ -59,8 +94,7 @@ def show_latest_summary(df):
         print(f"YoY (Seasonally adjusted): {s['sa_yoy_pct']:.2f}%")
 
 
-def show_extremes(df):
-    s = summarize_series(df)
+def show_extremes(s):
     print("\nPeaks and troughs")
     print("-" * 64)
     print(f"Peak Trend: {s['trend_peak']:,} ({s['trend_peak_period']})")
@@ -69,15 +103,22 @@ def show_extremes(df):
     print(f"Trough Seasonally adjusted: {s['sa_trough']:,} ({s['sa_trough_period']})")
 
 
+CHARTS = [
+    (plot_trend_vs_sa, "dwellings_trend_vs_sa.png"),
+    (plot_sa_qoq, "dwellings_sa_qoq.png"),
+    (plot_sa_with_ma, "dwellings_sa_moving_avg.png"),
+]
+
+
 def generate_charts(df):
     OUTDIR.mkdir(parents=True, exist_ok=True)
-    plot_trend_vs_sa(df, save_path=str(OUTDIR / "dwellings_trend_vs_sa.png"), show=False)
-    plot_sa_qoq(df, save_path=str(OUTDIR / "dwellings_sa_qoq.png"), show=False)
-    plot_sa_with_ma(df, save_path=str(OUTDIR / "dwellings_sa_moving_avg.png"), show=False)
+    # Rendered in-process: the charts share one Agg Figure, and a worker pool
+    # would pay matplotlib's import and setup again in every process
+    for plot, filename in CHARTS:
+        plot(df, save_path=str(OUTDIR / filename), show=False)
     print(f"\nSaved charts to: {OUTDIR.resolve()}")
-    print(" - dwellings_trend_vs_sa.png")
-    print(" - dwellings_sa_qoq.png")
-    print(" - dwellings_sa_moving_avg.png")
+    for _, filename in CHARTS:
+        print(f" - {filename}")
 
 
 def export_cleaned(df):
@@ -85,19 +126,26 @@ def export_cleaned(df):
     out_csv = OUTDIR / "dwellings_clean_with_metrics.csv"
     df.to_csv(out_csv, index=False)
     print(f"\nExported cleaned dataset to: {out_csv.resolve()}")
+    if HAS_PYARROW:
+        # Compact columnar copy alongside the CSV
+        out_parquet = out_csv.with_suffix(".parquet")
+        df.to_parquet(out_parquet, engine="pyarrow", compression="zstd", index=False)
+        print(f"Parquet copy: {out_parquet.resolve()}")
 
 
 def main():
     print_header()
     df = ensure_data()
+    # Options 1 and 2 share one summary instead of rescanning the columns each time
+    summary = summarize_series(df)
 
     while True:
         print_menu()
         choice = input("\nEnter choice (1-5): ").strip()
         if choice == "1":
-            show_latest_summary(df)
+            show_latest_summary(summary)
         elif choice == "2":
-            show_extremes(df)
+            show_extremes(summary)
         elif choice == "3":
             generate_charts(df)
         elif choice == "4":